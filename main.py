@@ -7,10 +7,17 @@ PDF via PyLaTeX + pdflatex (2 runs for TOC + LastPage)
 
 from __future__ import annotations
 
+import hashlib
+import re
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from pylatex import Document, Section, Subsection, Figure, Tabular, Package, NoEscape
+from pylatex import Document, Section, Subsection, Figure, Package, NoEscape
 
 
 # ====== USER DETAILS ======
@@ -25,21 +32,37 @@ INPUT_EXCEL = "beam_data.xlsx"
 BEAM_IMAGE = "beam.png"
 OUTPUT_BASENAME = "Simply_Supported_Beam_Analysis_Soniya_Kuchekar"
 ERROR_LOG_FILE = "compile_error_tail.txt"
+# Plot data files are named <OUTPUT_BASENAME><suffix>, next to the .tex
+SFD_DATA_SUFFIX = "_sfd.dat"
+BMD_DATA_SUFFIX = "_bmd.dat"
+LATEX_CACHE_DIR = "latex_cache"
+LATEX_CACHE_SUFFIXES = (".aux", ".toc", ".out")
+
+# ====== PLOTS ======
+# Diagrams with more points than this are simplified (Ramer-Douglas-Peucker)
+# with a tolerance of PLOT_TOLERANCE times the y-axis range.
+PLOT_SIMPLIFY_MIN_POINTS = 500
+PLOT_TOLERANCE = 0.002
+
+# ====== COLUMN DETECTION ======
+# Lower-cased, stripped header patterns for the Position, Shear and Moment columns
+POSITION_PATTERN = r"position|^(?:x|distance|dist|length)$"
+SHEAR_PATTERN = "shear"
+MOMENT_PATTERN = "moment"
 
 
 def pick_columns(df: pd.DataFrame) -> tuple[str, str, str]:
     """Detect the Position, Shear, and Moment columns."""
     df.columns = df.columns.str.strip()
-    pos = shear = moment = None
+    lower = df.columns.str.lower()
+
+    def first_match(pattern: str) -> str | None:
+        hits = df.columns[lower.str.contains(pattern, regex=True)]
+        return hits[0] if len(hits) else None
 
-    for c in df.columns:
-        cl = c.lower()
-        if pos is None and ("position" in cl or cl in ["x", "distance", "dist", "length"]):
-            pos = c
-        if shear is None and "shear" in cl:
-            shear = c
-        if moment is None and "moment" in cl:
-            moment = c
+    pos = first_match(POSITION_PATTERN)
+    shear = first_match(SHEAR_PATTERN)
+    moment = first_match(MOMENT_PATTERN)
 
     if not all([pos, shear, moment]):
         raise ValueError(
@@ -49,19 +72,167 @@ def pick_columns(df: pd.DataFrame) -> tuple[str, str, str]:
     return pos, shear, moment
 
 
-def run_pdflatex_twice(tex_path: Path) -> None:
+def is_beam_column(name: object) -> bool:
+    """usecols filter: True for headers pick_columns could choose."""
+    cl = str(name).strip().lower()
+    return any(re.search(p, cl) for p in (POSITION_PATTERN, SHEAR_PATTERN, MOMENT_PATTERN))
+
+
+def aux_digest(aux_path: Path) -> bytes | None:
+    """Hash of an .aux file, or None if it does not exist yet."""
+    if not aux_path.exists():
+        return None
+    return hashlib.blake2b(aux_path.read_bytes()).digest()
+
+
+def ensure_format(tex_path: Path, builddir: Path, cache_dir: Path) -> str | None:
+    """
+    Dump the document preamble into a precompiled format (mylatexformat) in
+    builddir, reusing the cached one while the preamble and the pdflatex
+    version are unchanged. Returns the format name, or None if it could not
+    be built. A failed dump is remembered (.nofmt) so it is not retried on
+    every build while the preamble and version stay the same.
+    """
+    tex_bytes = tex_path.read_bytes()
+    if b"\\begin{document}" not in tex_bytes:
+        return None
+    preamble = tex_bytes.split(b"\\begin{document}", 1)[0]
+    # Formats only load in the pdflatex build that dumped them
+    version = subprocess.run(
+        ["pdflatex", "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    ).stdout
+    digest = hashlib.blake2b(version + b"\0" + preamble).hexdigest()
+    fmt_name = f"{tex_path.stem}_preamble"
+    cached_fmt = cache_dir / f"{fmt_name}.fmt"
+    cached_hash = cache_dir / f"{fmt_name}.hash"
+    no_fmt = cache_dir / f"{fmt_name}.nofmt"
+
+    if cached_fmt.exists() and cached_hash.exists() and cached_hash.read_text() == digest:
+        shutil.copy2(cached_fmt, builddir / cached_fmt.name)
+        return fmt_name
+    if no_fmt.exists() and no_fmt.read_text() == digest:
+        return None
+
+    p = subprocess.run(
+        ["pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={fmt_name}",
+         "&pdflatex", "mylatexformat.ltx", tex_path.name],
+        cwd=builddir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    cache_dir.mkdir(exist_ok=True)
+    if p.returncode != 0 or not (builddir / cached_fmt.name).exists():
+        no_fmt.write_text(digest)
+        return None
+    shutil.copy2(builddir / cached_fmt.name, cached_fmt)
+    cached_hash.write_text(digest)
+    return fmt_name
+
+
+def discard_format(cache_dir: Path, fmt_name: str) -> str | None:
+    """Remove a cached format that pdflatex refused to load; returns its hash."""
+    cached_hash = cache_dir / f"{fmt_name}.hash"
+    digest = cached_hash.read_text() if cached_hash.exists() else None
+    (cache_dir / f"{fmt_name}.fmt").unlink(missing_ok=True)
+    cached_hash.unlink(missing_ok=True)
+    return digest
+
+
+def source_digest(workdir: Path, tex_file: str) -> str:
+    """Hash of the .tex, every file it pulls in, and today's date (for \\today)."""
+    h = hashlib.blake2b(date.today().isoformat().encode())
+    stem = Path(tex_file).stem
+    for name in (tex_file, BEAM_IMAGE, stem + SFD_DATA_SUFFIX, stem + BMD_DATA_SUFFIX):
+        path = workdir / name
+        if path.exists():
+            h.update(name.encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def build_pdf(tex_path: Path) -> None:
     """
-    Run pdflatex twice (TOC and LastPage need 2 runs).
+    Compile the .tex with pdflatex (up to 2 runs for TOC and LastPage).
     If it fails, saves log tail to compile_error_tail.txt.
     """
     workdir = tex_path.parent
     tex_file = tex_path.name
-    cmd = ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", tex_file]
-
-    for run_no in (1, 2):
-        p = subprocess.run(cmd, cwd=workdir, capture_output=True, text=True)
-        if p.returncode != 0:
-            tail = (p.stdout[-4500:] + "\n" + p.stderr[-4500:]).strip()
+    cache_dir = workdir / LATEX_CACHE_DIR
+    src_hash = source_digest(workdir, tex_file)
+    src_stamp = cache_dir / f"{tex_path.stem}.src.hash"
+    # Like latexmk: nothing to do if the PDF exists and no source (or the date) changed
+    if (workdir / f"{tex_path.stem}.pdf").exists() and src_stamp.exists() \
+            and src_stamp.read_text() == src_hash:
+        return
+
+    # Build in a scratch dir (tmpfs when available) so .aux/.log churn stays
+    # off disk; only the PDF and the cached intermediates come back.
+    shm = Path("/dev/shm")
+    builddir = Path(tempfile.mkdtemp(prefix="beamtex_", dir=shm if shm.is_dir() else None))
+    aux_path = builddir / f"{tex_path.stem}.aux"
+    cmd = ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", f"-output-directory={builddir}"]
+
+    try:
+        shutil.copy2(tex_path, builddir / tex_file)
+        for asset in (BEAM_IMAGE, tex_path.stem + SFD_DATA_SUFFIX, tex_path.stem + BMD_DATA_SUFFIX):
+            if (workdir / asset).exists():
+                shutil.copy2(workdir / asset, builddir / asset)
+        # Precompiled preamble, when one can be built (None otherwise)
+        fmt_name = ensure_format(builddir / tex_file, builddir, cache_dir)
+
+        def run_passes(fmt: str | None) -> tuple[int, str] | None:
+            """Both pdflatex runs; returns (run_no, output tail) on failure."""
+            # Start from the last build's .aux/.toc/.out (kept in latex_cache/)
+            for suffix in LATEX_CACHE_SUFFIXES:
+                cached = cache_dir / f"{tex_path.stem}{suffix}"
+                if cached.exists():
+                    shutil.copy2(cached, builddir / cached.name)
+                else:
+                    (builddir / cached.name).unlink(missing_ok=True)
+            base_cmd = cmd + [f"-fmt={fmt}"] if fmt is not None else cmd
+            prev_aux_hash = aux_digest(aux_path)
+            # Without a cached .aux, run 1 only populates it: -draftmode skips PDF output
+            draft_first = prev_aux_hash is None
+            cmds = [
+                base_cmd + ["-draftmode", tex_file] if draft_first else base_cmd + [tex_file],
+                base_cmd + [tex_file],
+            ]
+
+            for run_no in (1, 2):
+                # The draft pass's terminal output is never shown, so don't pipe it;
+                # if it fails, the .log holds the same error.
+                draft = run_no == 1 and draft_first
+                p = subprocess.run(
+                    cmds[run_no - 1], cwd=builddir, text=True, close_fds=True,
+                    stdout=subprocess.DEVNULL if draft else subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                if p.returncode != 0:
+                    out = p.stdout
+                    if out is None:
+                        log_path = builddir / f"{tex_path.stem}.log"
+                        out = log_path.read_text(errors="ignore") if log_path.exists() else ""
+                    return run_no, (out[-4500:] + "\n" + p.stderr[-4500:]).strip()
+                # An unchanged .aux means references are settled: skip run 2
+                if run_no == 1 and not draft_first and aux_digest(aux_path) == prev_aux_hash:
+                    break
+            return None
+
+        failure = run_passes(fmt_name)
+        if failure is not None:
+            # The scratch dir is removed below; keep this run's full log
+            log_path = builddir / f"{tex_path.stem}.log"
+            if log_path.exists():
+                shutil.copy2(log_path, workdir / log_path.name)
+        if failure is not None and fmt_name is not None:
+            # Retry once with the stock format. Only if that works was the
+            # cached format at fault (e.g. a TeX upgrade): drop it and don't
+            # redump it. Otherwise keep it and report the first error.
+            if run_passes(None) is None:
+                digest = discard_format(cache_dir, fmt_name)
+                if digest is not None:
+                    (cache_dir / f"{fmt_name}.nofmt").write_text(digest)
+                failure = None
+        if failure is not None:
+            run_no, tail = failure
             (workdir / ERROR_LOG_FILE).write_text(
                 f"PDLATEX FAILED ON RUN {run_no}\n\n{tail}\n",
                 encoding="utf-8",
@@ -72,18 +243,79 @@ def run_pdflatex_twice(tex_path: Path) -> None:
                 f"Open '{ERROR_LOG_FILE}' in the folder to see the exact LaTeX error."
             )
 
+        shutil.move(str(builddir / f"{tex_path.stem}.pdf"), str(workdir / f"{tex_path.stem}.pdf"))
+        cache_dir.mkdir(exist_ok=True)
+        for suffix in LATEX_CACHE_SUFFIXES:
+            produced = builddir / f"{tex_path.stem}{suffix}"
+            if produced.exists():
+                shutil.copy2(produced, cache_dir / produced.name)
+        src_stamp.write_text(src_hash)
+    finally:
+        shutil.rmtree(builddir, ignore_errors=True)
 
-def sfd_plot(df: pd.DataFrame, x_col: str, v_col: str, L: float) -> NoEscape:
-    """Shear Force Diagram using TikZ/pgfplots vector plot."""
-    sdf = df.sort_values(x_col).reset_index(drop=True)
-    vmin = float(sdf[v_col].min())
-    vmax = float(sdf[v_col].max())
-    pad = max(5.0, 0.12 * (abs(vmin) + abs(vmax)))
-    ymin, ymax = vmin - pad, vmax + pad
 
-    coords = "\n".join(
-        f"({float(r[x_col])}, {float(r[v_col])})" for _, r in sdf.iterrows()
-    )
+def axis_limits(ys: np.ndarray, floor_at_zero: bool = False) -> tuple[float, float]:
+    """Padded y-axis limits for a diagram (optionally keeping 0 in view); blank cells are ignored."""
+    lo = float(np.nanmin(ys))
+    hi = float(np.nanmax(ys))
+    pad = max(5.0, 0.12 * (abs(lo) + abs(hi)))
+    ymin = min(0.0, lo - pad) if floor_at_zero else lo - pad
+    return ymin, hi + pad
+
+
+def simplify_polyline(xs: np.ndarray, ys: np.ndarray, eps: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker on y = f(x): indices of the points to keep so that
+    no dropped point is more than eps (vertically) off the simplified line.
+    Blank (NaN) cells are kept as breaks and each run between them is
+    simplified on its own, so NaN never reaches the distance test.
+    """
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    keep = ~finite
+    starts = np.flatnonzero(finite & ~np.r_[False, finite[:-1]])
+    ends = np.flatnonzero(finite & ~np.r_[finite[1:], False])
+    stack = []
+    for a, b in zip(starts.tolist(), ends.tolist()):
+        keep[[a, b]] = True
+        stack.append((a, b))
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        dx = xs[j] - xs[i]
+        dy = ys[j] - ys[i]
+        off = ys[i + 1:j] - ys[i]
+        if dx != 0:
+            off = off - dy * (xs[i + 1:j] - xs[i]) / dx
+        dist = np.abs(off)
+        k = int(np.argmax(dist))
+        if dist[k] > eps:
+            k += i + 1
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    return np.flatnonzero(keep)
+
+
+def plot_points(xs: np.ndarray, ys: np.ndarray, ymin: float, ymax: float) -> tuple[np.ndarray, np.ndarray]:
+    """Points to draw; long series are simplified to keep pgfplots fast."""
+    if len(xs) <= PLOT_SIMPLIFY_MIN_POINTS:
+        return xs, ys
+    idx = simplify_polyline(xs, ys, PLOT_TOLERANCE * (ymax - ymin))
+    return xs[idx], ys[idx]
+
+
+def sfd_plot(data: np.ndarray, L: float, dat_path: Path) -> NoEscape:
+    """
+    Shear Force Diagram using TikZ/pgfplots vector plot (data columns: x, V, M).
+    The plotted points are written to dat_path (next to the .tex) and read
+    with \\addplot table.
+    """
+    xs, ys = data[:, 0], data[:, 1]
+    ymin, ymax = axis_limits(ys)
+    xs, ys = plot_points(xs, ys, ymin, ymax)
+
+    np.savetxt(dat_path, np.column_stack((xs, ys)), fmt="%.6g")
 
     return NoEscape(rf"""
 \begin{{figure}}[H]
@@ -106,9 +338,7 @@ def sfd_plot(df: pd.DataFrame, x_col: str, v_col: str, L: float) -> NoEscape:
     label style={{font=\small}},
 ]
 \addplot[blue!75!black, very thick, mark=*, mark size=1.7pt]
-coordinates {{
-{coords}
-}};
+table[x index=0, y index=1] {{{dat_path.name}}};
 \addplot[black, dashed, thick] coordinates {{(0,0) ({L:.2f},0)}};
 \end{{axis}}
 \end{{tikzpicture}}
@@ -117,17 +347,17 @@ coordinates {{
 """)
 
 
-def bmd_plot(df: pd.DataFrame, x_col: str, m_col: str, L: float) -> NoEscape:
-    """Bending Moment Diagram using TikZ/pgfplots vector plot."""
-    sdf = df.sort_values(x_col).reset_index(drop=True)
-    mmin = float(sdf[m_col].min())
-    mmax = float(sdf[m_col].max())
-    pad = max(5.0, 0.12 * (abs(mmin) + abs(mmax)))
-    ymin, ymax = min(0.0, mmin - pad), mmax + pad
+def bmd_plot(data: np.ndarray, L: float, dat_path: Path) -> NoEscape:
+    """
+    Bending Moment Diagram using TikZ/pgfplots vector plot (data columns: x, V, M).
+    The plotted points are written to dat_path (next to the .tex) and read
+    with \\addplot table.
+    """
+    xs, ys = data[:, 0], data[:, 2]
+    ymin, ymax = axis_limits(ys, floor_at_zero=True)
+    xs, ys = plot_points(xs, ys, ymin, ymax)
 
-    coords = "\n".join(
-        f"({float(r[x_col])}, {float(r[m_col])})" for _, r in sdf.iterrows()
-    )
+    np.savetxt(dat_path, np.column_stack((xs, ys)), fmt="%.6g")
 
     return NoEscape(rf"""
 \begin{{figure}}[H]
@@ -150,9 +380,7 @@ def bmd_plot(df: pd.DataFrame, x_col: str, m_col: str, L: float) -> NoEscape:
     label style={{font=\small}},
 ]
 \addplot[red!80!black, very thick, mark=*, mark size=1.7pt]
-coordinates {{
-{coords}
-}};
+table[x index=0, y index=1] {{{dat_path.name}}};
 \end{{axis}}
 \end{{tikzpicture}}
 \vspace{{-2mm}}
@@ -161,9 +389,17 @@ coordinates {{
 
 
 def build_report() -> Path:
-    df = pd.read_excel(INPUT_EXCEL)
+    # One read that keeps only candidate columns, so unrelated (e.g. text)
+    # columns are never type-inferred or converted
+    df = pd.read_excel(INPUT_EXCEL, usecols=is_beam_column)
     x_col, v_col, m_col = pick_columns(df)
-    L = float(df[x_col].max())
+    # [x, V, M] rows as float64 sorted by position, gathered straight into one
+    # array (float64 columns are read as views; no column selection or sorted copy)
+    order = np.argsort(df[x_col].to_numpy(dtype=np.float64), kind="stable")
+    data = np.empty((len(order), 3))
+    for j, col in enumerate((x_col, v_col, m_col)):
+        np.take(df[col].to_numpy(dtype=np.float64), order, out=data[:, j])
+    L = float(np.nanmax(data[:, 0]))
 
     doc = Document(documentclass="report", document_options=["12pt", "a4paper"], lmodern=True)
 
@@ -187,37 +423,30 @@ def build_report() -> Path:
     doc.packages.append(Package("microtype"))
     doc.preamble.append(NoEscape(r"\pgfplotsset{compat=1.18}"))
 
-    # Hyperlinks
-    doc.preamble.append(NoEscape(r"""
-\hypersetup{
+    # Hyperlinks, spacing, headings, header/footer (one preamble block)
+    doc.preamble.append(NoEscape(rf"""
+\hypersetup{{
   colorlinks=true,
   linkcolor=black,
   urlcolor=black,
   citecolor=black
-}
-"""))
-
-    # Spacing
-    doc.preamble.append(NoEscape(r"\onehalfspacing"))
-    doc.preamble.append(NoEscape(r"\setlength{\parindent}{0pt}"))
-    doc.preamble.append(NoEscape(r"\setlength{\parskip}{9pt}"))
-    doc.preamble.append(NoEscape(r"\setlength{\textfloatsep}{16pt}"))
-    doc.preamble.append(NoEscape(r"\setlength{\intextsep}{16pt}"))
-    doc.preamble.append(NoEscape(r"\setlength{\abovecaptionskip}{6pt}"))
-    doc.preamble.append(NoEscape(r"\setlength{\belowcaptionskip}{6pt}"))
-    doc.preamble.append(NoEscape(r"\renewcommand{\contentsname}{Table of Contents}"))
-
-    # Headings
-    doc.preamble.append(NoEscape(r"""
-\titleformat{\section}{\Large\bfseries}{\thesection.}{0.9em}{}
-\titleformat{\subsection}{\large\bfseries}{\thesubsection}{0.9em}{}
-\titlespacing*{\section}{0pt}{22pt}{10pt}
-\titlespacing*{\subsection}{0pt}{14pt}{8pt}
-"""))
-
-    # Header/footer
-    doc.preamble.append(NoEscape(r"\setlength{\headheight}{15pt}"))
-    doc.preamble.append(NoEscape(rf"""
+}}
+
+\onehalfspacing
+\setlength{{\parindent}}{{0pt}}
+\setlength{{\parskip}}{{9pt}}
+\setlength{{\textfloatsep}}{{16pt}}
+\setlength{{\intextsep}}{{16pt}}
+\setlength{{\abovecaptionskip}}{{6pt}}
+\setlength{{\belowcaptionskip}}{{6pt}}
+\renewcommand{{\contentsname}}{{Table of Contents}}
+
+\titleformat{{\section}}{{\Large\bfseries}}{{\thesection.}}{{0.9em}}{{}}
+\titleformat{{\subsection}}{{\large\bfseries}}{{\thesubsection}}{{0.9em}}{{}}
+\titlespacing*{{\section}}{{0pt}}{{22pt}}{{10pt}}
+\titlespacing*{{\subsection}}{{0pt}}{{14pt}}{{8pt}}
+
+\setlength{{\headheight}}{{15pt}}
 \pagestyle{{fancy}}
 \fancyhf{{}}
 \lhead{{\textbf{{{REPORT_TITLE}}}}}
@@ -228,31 +457,32 @@ def build_report() -> Path:
 """))
 
     def lead(text: str) -> None:
-        doc.append(NoEscape(r"\vspace{-2pt}"))
-        doc.append(NoEscape(rf"\textit{{{text}}}"))
-        doc.append(NoEscape(r"\vspace{6pt}"))
+        doc.append(NoEscape(rf"""\vspace{{-2pt}}%
+\textit{{{text}}}%
+\vspace{{6pt}}"""))
 
     # =========================================================
     # 1) TITLE PAGE
     # =========================================================
-    doc.append(NoEscape(r"\thispagestyle{empty}"))
-    doc.append(NoEscape(r"\begin{tikzpicture}[remember picture,overlay]"))
-    doc.append(NoEscape(r"\fill[black!6] (current page.north west) rectangle ([yshift=-3.8cm]current page.north east);"))
-    doc.append(NoEscape(r"\fill[black!22] (current page.north west) rectangle ([xshift=0.35cm,yshift=-3.8cm]current page.north west);"))
-    doc.append(NoEscape(r"\end{tikzpicture}"))
-
-    doc.append(NoEscape(r"\vspace*{2.2cm}"))
-    doc.append(NoEscape(r"\begin{center}"))
-    doc.append(NoEscape(rf"{{\Huge\bfseries {REPORT_TITLE}}}\\[0.35cm]"))
-    doc.append(NoEscape(rf"{{\Large {REPORT_SUBTITLE}}}\\[0.35cm]"))
-    doc.append(NoEscape(rf"{{\large {INSTITUTE_LINE}}}\\[0.9cm]"))
-    doc.append(NoEscape(r"\rule{0.74\textwidth}{0.7pt}\\[0.7cm]"))
-    doc.append(NoEscape(rf"{{\Large \textbf{{Author:}} {AUTHOR_NAME}}}\\[0.25cm]"))
-    doc.append(NoEscape(rf"{{\large \textbf{{Report ID:}} {REPORT_ID}}}\\[0.25cm]"))
-    doc.append(NoEscape(r"{\large \textbf{Date:} \today}"))
-    doc.append(NoEscape(r"\end{center}"))
-    doc.append(NoEscape(r"\vfill"))
-    doc.append(NoEscape(r"\newpage"))
+    doc.append(NoEscape(rf"""
+\thispagestyle{{empty}}
+\begin{{tikzpicture}}[remember picture,overlay]
+\fill[black!6] (current page.north west) rectangle ([yshift=-3.8cm]current page.north east);
+\fill[black!22] (current page.north west) rectangle ([xshift=0.35cm,yshift=-3.8cm]current page.north west);
+\end{{tikzpicture}}%
+\vspace*{{2.2cm}}
+\begin{{center}}
+{{\Huge\bfseries {REPORT_TITLE}}}\\[0.35cm]
+{{\Large {REPORT_SUBTITLE}}}\\[0.35cm]
+{{\large {INSTITUTE_LINE}}}\\[0.9cm]
+\rule{{0.74\textwidth}}{{0.7pt}}\\[0.7cm]
+{{\Large \textbf{{Author:}} {AUTHOR_NAME}}}\\[0.25cm]
+{{\large \textbf{{Report ID:}} {REPORT_ID}}}\\[0.25cm]
+{{\large \textbf{{Date:}} \today}}
+\end{{center}}
+\vfill
+\newpage
+"""))
 
     # =========================================================
     # 2) TABLE OF CONTENTS (ONLY ONCE ✅)
@@ -288,64 +518,58 @@ def build_report() -> Path:
     with doc.create(Section("Input Data")):
         lead("This section recreates the Excel dataset using a LaTeX table (not inserted as an image).")
 
-        sdf = df.sort_values(x_col).reset_index(drop=True)
-
-        doc.append(NoEscape(r"\renewcommand{\arraystretch}{1.25}"))
-        doc.append(NoEscape(r"\rowcolors{2}{black!4}{white}"))
-        doc.append(NoEscape(r"\begin{center}"))
-
-        with doc.create(Tabular(NoEscape(
-            r"@{}>{\centering\arraybackslash}p{3.7cm}"
-            r">{\centering\arraybackslash}p{5.3cm}"
-            r">{\centering\arraybackslash}p{5.3cm}@{}"
-        ))) as table:
-            doc.append(NoEscape(r"\toprule"))
-            table.add_row(
-                NoEscape(r"\textbf{Position (m)}"),
-                NoEscape(r"\textbf{Shear Force (kN)}"),
-                NoEscape(r"\textbf{Bending Moment (kNm)}")
-            )
-            doc.append(NoEscape(r"\midrule"))
-            for _, r in sdf.iterrows():
-                table.add_row(
-                    f"{float(r[x_col]):.2f}",
-                    f"{float(r[v_col]):.2f}",
-                    f"{float(r[m_col]):.2f}"
-                )
-            doc.append(NoEscape(r"\bottomrule"))
-
-        doc.append(NoEscape(r"\end{center}"))
+        body = "\n".join(f"{x:.2f} & {v:.2f} & {m:.2f} \\\\" for x, v, m in data.tolist())
+
+        doc.append(NoEscape(rf"""
+\renewcommand{{\arraystretch}}{{1.25}}
+\rowcolors{{2}}{{black!4}}{{white}}
+\begin{{center}}
+\begin{{tabular}}{{@{{}}>{{\centering\arraybackslash}}p{{3.7cm}}>{{\centering\arraybackslash}}p{{5.3cm}}>{{\centering\arraybackslash}}p{{5.3cm}}@{{}}}}
+\toprule
+\textbf{{Position (m)}} & \textbf{{Shear Force (kN)}} & \textbf{{Bending Moment (kNm)}} \\
+\midrule
+{body}
+\bottomrule
+\end{{tabular}}
+\end{{center}}
+"""))
         doc.append(NoEscape(r"\rowcolors{2}{}{}"))
 
     # =========================================================
     # 5) ANALYSIS (alignment fixed)
     # =========================================================
-    with doc.create(Section("Analysis")):
+    with doc.create(Section("Analysis")), ThreadPoolExecutor(max_workers=2) as pool:
+        # SFD and BMD only read their own columns of data, so build them side
+        # by side; their .dat files go next to the .tex
+        base = Path(OUTPUT_BASENAME)
+        sfd_fut = pool.submit(sfd_plot, data, L, base.with_name(base.name + SFD_DATA_SUFFIX))
+        bmd_fut = pool.submit(bmd_plot, data, L, base.with_name(base.name + BMD_DATA_SUFFIX))
+
         lead("This section presents engineering diagrams generated as TikZ/pgfplots vector plots for high-quality output.")
 
         doc.append(NoEscape(r"\Needspace{16\baselineskip}"))
         with doc.create(Subsection("Shear Force Diagram")):
             doc.append(NoEscape(r"\begin{samepage}"))
             doc.append("The Shear Force Diagram (SFD) illustrates the variation of shear force along the beam span.")
-            doc.append(sfd_plot(df, x_col, v_col, L))
+            doc.append(sfd_fut.result())
             doc.append(NoEscape(r"\end{samepage}"))
 
         doc.append(NoEscape(r"\Needspace{16\baselineskip}"))
         with doc.create(Subsection("Bending Moment Diagram")):
             doc.append(NoEscape(r"\begin{samepage}"))
             doc.append("The Bending Moment Diagram (BMD) represents the bending moment distribution along the span.")
-            doc.append(bmd_plot(df, x_col, m_col, L))
+            doc.append(bmd_fut.result())
             doc.append(NoEscape(r"\end{samepage}"))
 
-    # Write .tex
-    base = Path(OUTPUT_BASENAME)
-    doc.generate_tex(str(base))
-    return base.with_suffix(".tex")
+    # Write .tex (rendered to one string, written in one go)
+    tex_path = Path(OUTPUT_BASENAME).with_suffix(".tex")
+    tex_path.write_text(doc.dumps(), encoding="utf-8")
+    return tex_path
 
 
 def main():
     tex_path = build_report()
-    run_pdflatex_twice(tex_path)
+    build_pdf(tex_path)
     print(f"✅ PDF created: {OUTPUT_BASENAME}.pdf")
 
 